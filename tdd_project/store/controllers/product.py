@@ -1,18 +1,28 @@
 from decimal import Decimal
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 from fastapi import APIRouter, Body, Depends, HTTPException, Path, status, Query
+from fastapi.responses import StreamingResponse
 from pydantic import UUID4
-from store.core.exceptions import NotFoundException, InsertionException
+from store.core.exceptions import (
+    FilterException,
+    InsertionException,
+    NotFoundException,
+)
 
 from store.schemas.product import ProductIn, ProductOut, ProductUpdate, ProductUpdateOut
-from store.usecases.product import ProductUsecase
+from store.usecases.product import (
+    BULK_CREATE_MAX_SIZE,
+    QUERY_MAX_LIMIT,
+    ProductUsecase,
+    get_product_usecase,
+)
 
 router = APIRouter(tags=["products"])
 
 
 @router.post(path="/", status_code=status.HTTP_201_CREATED)
 async def post(
-    body: ProductIn = Body(...), usecase: ProductUsecase = Depends()
+    body: ProductIn = Body(...), usecase: ProductUsecase = Depends(get_product_usecase)
 ) -> ProductOut:
     try:
         return await usecase.create(body=body)
@@ -20,9 +30,20 @@ async def post(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=exc.message)
 
 
+@router.post(path="/bulk", status_code=status.HTTP_201_CREATED)
+async def bulk_post(
+    body: List[ProductIn] = Body(..., min_length=1, max_length=BULK_CREATE_MAX_SIZE),
+    usecase: ProductUsecase = Depends(get_product_usecase),
+) -> List[ProductOut]:
+    try:
+        return await usecase.bulk_create(bodies=body)
+    except InsertionException as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=exc.message)
+
+
 @router.get(path="/{id}", status_code=status.HTTP_200_OK)
 async def get(
-    id: UUID4 = Path(alias="id"), usecase: ProductUsecase = Depends()
+    id: UUID4 = Path(alias="id"), usecase: ProductUsecase = Depends(get_product_usecase)
 ) -> ProductOut:
     try:
         return await usecase.get(id=id)
@@ -32,22 +53,44 @@ async def get(
 
 @router.get(path="/", status_code=status.HTTP_200_OK)
 async def query(
-    usecase: ProductUsecase = Depends(),
+    usecase: ProductUsecase = Depends(get_product_usecase),
     min_price: Optional[Decimal] = Query(
         None, description="Minimum price for filtering"
     ),
     max_price: Optional[Decimal] = Query(
         None, description="Maximum price for filtering"
     ),
-) -> List[ProductOut]:
-    return await usecase.query(min_price=min_price, max_price=max_price)
+    product_status: Optional[bool] = Query(
+        None, alias="status", description="Product status for filtering"
+    ),
+    limit: int = Query(
+        50, ge=1, le=QUERY_MAX_LIMIT, description="Maximum number of products returned"
+    ),
+    skip: int = Query(0, ge=0, description="Number of products to skip"),
+) -> StreamingResponse:
+    try:
+        products = await usecase.query(
+            min_price=min_price,
+            max_price=max_price,
+            status=product_status,
+            limit=limit,
+            skip=skip,
+        )
+    except FilterException as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=exc.message)
+
+    async def ndjson() -> AsyncIterator[str]:
+        async for product in products:
+            yield product.model_dump_json() + "\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
 
 
 @router.patch(path="/{id}", status_code=status.HTTP_200_OK)
 async def patch(
     id: UUID4 = Path(alias="id"),
     body: ProductUpdate = Body(...),
-    usecase: ProductUsecase = Depends(),
+    usecase: ProductUsecase = Depends(get_product_usecase),
 ) -> ProductUpdateOut:
     try:
         return await usecase.update(id=id, body=body)
@@ -59,7 +102,7 @@ async def patch(
 
 @router.delete(path="/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete(
-    id: UUID4 = Path(alias="id"), usecase: ProductUsecase = Depends()
+    id: UUID4 = Path(alias="id"), usecase: ProductUsecase = Depends(get_product_usecase)
 ) -> None:
     try:
         await usecase.delete(id=id)
@@ -7,6 +7,10 @@ class Settings(BaseSettings):
     ROOT_PATH: str = "/"
 
     DATABASE_URL: str
+    DATABASE_MAX_POOL_SIZE: int = 200
+    DATABASE_MIN_POOL_SIZE: int = 10
+    DATABASE_MAX_IDLE_TIME_MS: int = 300000
+    DATABASE_WAIT_QUEUE_TIMEOUT_MS: int = 5000
 
     model_config = SettingsConfigDict(env_file=".env")
 
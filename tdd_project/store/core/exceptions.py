@@ -12,3 +12,7 @@ class NotFoundException(BaseException):
 
 class InsertionException(BaseException):
     message: str = "Error inserting product"
+
+
+class FilterException(BaseException):
+    message: str = "Invalid filter"
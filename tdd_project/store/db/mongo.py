@@ -1,12 +1,20 @@
-from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import AsyncMongoClient
 from store.core.config import settings
 
 
 class MongoClient:
     def __init__(self) -> None:
-        self.client: AsyncIOMotorClient = AsyncIOMotorClient(settings.DATABASE_URL)
+        self.client: AsyncMongoClient = AsyncMongoClient(
+            settings.DATABASE_URL,
+            tz_aware=True,
+            uuidRepresentation="standard",
+            maxPoolSize=settings.DATABASE_MAX_POOL_SIZE,
+            minPoolSize=settings.DATABASE_MIN_POOL_SIZE,
+            maxIdleTimeMS=settings.DATABASE_MAX_IDLE_TIME_MS,
+            waitQueueTimeoutMS=settings.DATABASE_WAIT_QUEUE_TIMEOUT_MS,
+        )
 
-    def get(self) -> AsyncIOMotorClient:
+    def get(self) -> AsyncMongoClient:
         return self.client
 
 
@@ -1,5 +1,16 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from store.core.config import settings
+from store.routers import api_router
+from store.usecases.product import get_product_usecase
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    product_usecase = get_product_usecase()
+    await product_usecase.client.admin.command("ping")
+    await product_usecase.ensure_indexes()
+    yield
 
 
 class App(FastAPI):
@@ -10,7 +21,9 @@ class App(FastAPI):
             version="0.1.0",
             title=settings.PROJECT_NAME,
             root_path=settings.ROOT_PATH,
+            lifespan=lifespan,
         )
 
 
 app = App()
+app.include_router(api_router)
@@ -1,22 +1,35 @@
-from datetime import datetime
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Any
 import uuid
-from bson import Decimal128
-from pydantic import UUID4, BaseModel, Field, model_serializer
+from bson import Binary, Decimal128
+from pydantic import UUID4, BaseModel, ConfigDict, Field, model_serializer
+
+
+def utcnow() -> datetime:
+    now = datetime.now(timezone.utc)
+    # BSON dates only keep milliseconds, so truncate to round-trip unchanged
+    return now.replace(microsecond=now.microsecond // 1000 * 1000)
 
 
 class CreateBaseModel(BaseModel):
-    id: UUID4 = Field(default_factory=uuid.uuid4)
-    created_at: datetime = Field(default_factory=datetime.utcnow)
-    updated_at: datetime = Field(default_factory=datetime.utcnow)
+    model_config = ConfigDict(populate_by_name=True)
+
+    id: UUID4 = Field(default_factory=uuid.uuid4, alias="_id")
+    created_at: datetime = Field(default_factory=utcnow)
+    updated_at: datetime = Field(default_factory=utcnow)
 
     @model_serializer
     def set_model(self) -> dict[str, Any]:
-        self_dict = dict(self)
+        self_dict = {
+            field.alias or name: getattr(self, name)
+            for name, field in type(self).model_fields.items()
+        }
 
         for key, value in self_dict.items():
             if isinstance(value, Decimal):
-                self_dict[key] = Decimal128(str(value))
+                self_dict[key] = Decimal128(value)
+            elif isinstance(value, uuid.UUID):
+                self_dict[key] = Binary.from_uuid(value)
 
         return self_dict
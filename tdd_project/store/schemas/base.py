@@ -1,6 +1,7 @@
 from datetime import datetime
-from decimal import Decimal
-from bson import Decimal128
+from typing import Any, Self
+from bson import Binary, Decimal128
+from bson.binary import UUID_SUBTYPE
 from pydantic import UUID4, BaseModel, Field, model_validator
 
 
@@ -16,8 +17,17 @@ class OutSchema(BaseModel):
 
     @model_validator(mode="before")
     def set_schema(cls, data):
+        if "_id" in data:
+            data["id"] = data.pop("_id")
+
         for key, value in data.items():
             if isinstance(value, Decimal128):
-                data[key] = Decimal(str(value))
+                data[key] = value.to_decimal()
+            elif isinstance(value, Binary) and value.subtype == UUID_SUBTYPE:
+                data[key] = value.as_uuid()
 
         return data
+
+    @classmethod
+    def from_document(cls, document: dict[str, Any]) -> Self:
+        return cls.model_construct(**cls.set_schema(dict(document)))
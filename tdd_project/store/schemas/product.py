@@ -21,7 +21,7 @@ class ProductOut(ProductIn, OutSchema):
 
 
 def convert_decimal_128(v):
-    return Decimal128(str(v))
+    return Decimal128(v)
 
 
 Decimal_ = Annotated[Decimal, AfterValidator(convert_decimal_128)]
@@ -1,80 +1,198 @@
-import datetime
-from decimal import Decimal
-from typing import List, Optional
+from decimal import Decimal, DecimalException
+from functools import lru_cache
+from typing import AsyncIterator, List, Optional
 from uuid import UUID
-from motor.motor_asyncio import AsyncIOMotorClient, AsyncIOMotorDatabase
+from bson import Decimal128
 import pymongo
+from pymongo import AsyncMongoClient
+from pymongo.asynchronous.collection import AsyncCollection
+from pymongo.asynchronous.cursor import AsyncCursor
+from pymongo.asynchronous.database import AsyncDatabase
 from store.db.mongo import db_client
+from store.models.base import utcnow
 from store.models.product import ProductModel
 from store.schemas.product import ProductIn, ProductOut, ProductUpdate, ProductUpdateOut
-from store.core.exceptions import InsertionException, NotFoundException
+from store.core.exceptions import (
+    FilterException,
+    InsertionException,
+    NotFoundException,
+)
+
+PRODUCT_PROJECTION = {
+    "_id": 1,
+    "name": 1,
+    "quantity": 1,
+    "price": 1,
+    "status": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
+QUERY_BATCH_SIZE = 200
+QUERY_MAX_LIMIT = 500
+# _id breaks price ties so skip/limit pages are stable
+QUERY_SORT = [("price", pymongo.ASCENDING), ("_id", pymongo.ASCENDING)]
+BULK_CREATE_MAX_SIZE = 500
+
+_PRICE_BUILDERS = {
+    (True, True): lambda low, high: {"$gt": Decimal128(low), "$lt": Decimal128(high)},
+    (True, False): lambda low, _: {"$gt": Decimal128(low)},
+    (False, True): lambda _, high: {"$lt": Decimal128(high)},
+    (False, False): None,
+}
 
 
 class ProductUsecase:
     def __init__(self) -> None:
-        self.client: AsyncIOMotorClient = db_client.get()
-        self.database: AsyncIOMotorDatabase = self.client.get_database()
-        self.collection = self.database.get_collection("products")
+        self.client: AsyncMongoClient = db_client.get()
+        self.database: AsyncDatabase = self._database()
+        self.collection: AsyncCollection = self._collection("products")
+
+    @classmethod
+    @lru_cache(maxsize=1)
+    def _database(cls) -> AsyncDatabase:
+        return db_client.get().get_database()
+
+    @classmethod
+    @lru_cache(maxsize=None)
+    def _collection(cls, name: str) -> AsyncCollection:
+        return cls._database().get_collection(name)
+
+    async def ensure_indexes(self) -> None:
+        await self.collection.create_index([("name", pymongo.ASCENDING)], unique=True)
+        await self.collection.create_index(QUERY_SORT)
+        await self.collection.create_index([("status", pymongo.ASCENDING), *QUERY_SORT])
 
     async def create(self, body: ProductIn) -> ProductOut:
         try:
             product_model = ProductModel(**body.model_dump())
-            await self.collection.create_index(
-                [("name", pymongo.ASCENDING)], unique=True
-            )
-            await self.collection.insert_one(product_model.model_dump())
+            document = product_model.model_dump()
+            await self.collection.insert_one(document)
         except pymongo.errors.DuplicateKeyError:
             raise InsertionException(message="Product with this name already exists.")
         except Exception as e:
             raise InsertionException(message=f"Failed to insert product: {e}")
 
-        return ProductOut(**product_model.model_dump())
+        return ProductOut.from_document(document)
+
+    async def bulk_create(self, bodies: List[ProductIn]) -> List[ProductOut]:
+        try:
+            documents = [
+                ProductModel(**body.model_dump()).model_dump() for body in bodies
+            ]
+            await self.collection.insert_many(documents, ordered=False)
+        except pymongo.errors.BulkWriteError as e:
+            # ordered=False keeps inserting past failures, so report what was written
+            write_errors = e.details.get("writeErrors", [])
+            summary = (
+                f"inserted {e.details.get('nInserted', 0)} of {len(bodies)} products, "
+                f"failed indexes: {[error['index'] for error in write_errors]}"
+            )
+            if any(error["code"] == 11000 for error in write_errors):
+                raise InsertionException(
+                    message=f"Product with this name already exists ({summary})."
+                )
+            raise InsertionException(
+                message=f"Failed to insert products ({summary}): {e}"
+            )
+        except Exception as e:
+            raise InsertionException(message=f"Failed to insert products: {e}")
+
+        return [ProductOut.from_document(document) for document in documents]
 
     async def get(self, id: UUID) -> ProductOut:
-        result = await self.collection.find_one({"id": id})
+        result = await self.collection.find_one({"_id": id})
 
         if not result:
             raise NotFoundException(message=f"Product not found with filter: {id}")
 
-        return ProductOut(**result)
+        return ProductOut.from_document(result)
+
+    def build_cursor(
+        self,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        status: Optional[bool] = None,
+        limit: int = 50,
+        skip: int = 0,
+    ) -> AsyncCursor:
+        filter_query = {} if status is None else {"status": status}
+
+        builder = _PRICE_BUILDERS[(min_price is not None, max_price is not None)]
+        if builder:
+            try:
+                filter_query["price"] = builder(min_price, max_price)
+            except DecimalException:
+                raise FilterException(message="Price filter out of range.")
+
+        return (
+            self.collection.find(filter_query, projection=PRODUCT_PROJECTION)
+            .sort(QUERY_SORT)
+            .skip(skip)
+            .limit(limit)
+            .batch_size(QUERY_BATCH_SIZE)
+        )
 
     async def query(
-        self, min_price: Optional[Decimal] = None, max_price: Optional[Decimal] = None
-    ) -> List[ProductOut]:
-        filter_query = {}
+        self,
+        min_price: Optional[Decimal] = None,
+        max_price: Optional[Decimal] = None,
+        status: Optional[bool] = None,
+        limit: int = 50,
+        skip: int = 0,
+    ) -> AsyncIterator[ProductOut]:
+        cursor = self.build_cursor(
+            min_price=min_price,
+            max_price=max_price,
+            status=status,
+            limit=limit,
+            skip=skip,
+        )
+        first = await anext(cursor, None)
+
+        return self._stream(first, cursor)
 
-        if min_price is not None and max_price is not None:
-            filter_query["price"] = {"$gt": min_price, "$lt": max_price}
-        elif min_price is not None:
-            filter_query["price"] = {"$gt": min_price}
-        elif max_price is not None:
-            filter_query["price"] = {"$lt": max_price}
+    async def _stream(
+        self, first: Optional[dict], cursor: AsyncCursor
+    ) -> AsyncIterator[ProductOut]:
+        try:
+            if first is None:
+                return
 
-        return [ProductOut(**item) async for item in self.collection.find(filter_query)]
+            yield ProductOut.from_document(first)
+            async for item in cursor:
+                yield ProductOut.from_document(item)
+        finally:
+            await cursor.close()
 
     async def update(self, id: UUID, body: ProductUpdate) -> ProductUpdateOut:
         update_data = body.model_dump(exclude_none=True)
-        update_data["updated_at"] = datetime.utcnow()
+        update_data["updated_at"] = utcnow()
 
-        result = await self.collection.find_one_and_update(
-            filter={"id": id},
-            update={"$set": update_data},
-            return_document=pymongo.ReturnDocument.AFTER,
-        )
+        try:
+            result = await self.collection.find_one_and_update(
+                filter={"_id": id},
+                update={"$set": update_data},
+                return_document=pymongo.ReturnDocument.AFTER,
+            )
+        except Exception as e:
+            raise InsertionException(message=f"Failed to update product: {e}")
 
         if not result:
             raise NotFoundException(message=f"Product not found with filter: {id}")
 
-        return ProductUpdateOut(**result)
+        return ProductUpdateOut.from_document(result)
 
     async def delete(self, id: UUID) -> bool:
-        product = await self.collection.find_one({"id": id})
-        if not product:
-            raise NotFoundException(message=f"Product not found with filter: {id}")
+        result = await self.collection.find_one_and_delete(
+            {"_id": id}, projection={"_id": 1}
+        )
 
-        result = await self.collection.delete_one({"id": id})
+        if not result:
+            raise NotFoundException(message=f"Product not found with filter: {id}")
 
-        return True if result.deleted_count > 0 else False
+        return True
 
 
-product_usecase = ProductUsecase()
+@lru_cache(maxsize=1)
+def get_product_usecase() -> ProductUsecase:
+    return ProductUsecase()
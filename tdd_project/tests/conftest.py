@@ -4,16 +4,19 @@ import asyncio
 from uuid import UUID
 from store.db.mongo import db_client
 from store.schemas.product import ProductIn, ProductUpdate
-from store.usecases.product import product_usecase
+from store.usecases.product import get_product_usecase
 from tests.factories import product_data, products_data
-from httpx import AsyncClient
+from httpx import ASGITransport, AsyncClient
 
 
 @pytest.fixture(scope="session")
-def event_loop():
-    loop = asyncio.get_event_loop_policy().new_event_loop()
-    yield loop
-    loop.close()
+def product_usecase():
+    return get_product_usecase()
+
+
+@pytest.fixture(scope="session", autouse=True)
+async def ensure_indexes(product_usecase):
+    await product_usecase.ensure_indexes()
 
 
 @pytest.fixture
@@ -36,7 +39,9 @@ async def clear_collections(mongo_client):
 async def client() -> AsyncClient:
     from store.main import app
 
-    async with AsyncClient(app=app, base_url="http://test") as ac:
+    async with AsyncClient(
+        transport=ASGITransport(app=app), base_url="http://test"
+    ) as ac:
         yield ac
 
 
@@ -61,7 +66,7 @@ def product_up(product_id):
 
 
 @pytest.fixture
-async def product_inserted(product_in):
+async def product_inserted(product_usecase, product_in):
     return await product_usecase.create(body=product_in)
 
 
@@ -71,5 +76,7 @@ def products_in():
 
 
 @pytest.fixture
-async def products_inserted(products_in):
-    return [await product_usecase.create(body=product_in) for product_in in products_in]
+async def products_inserted(product_usecase, products_in):
+    return await asyncio.gather(
+        *(product_usecase.create(body=product_in) for product_in in products_in)
+    )
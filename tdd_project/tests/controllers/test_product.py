@@ -1,14 +1,20 @@
-import datetime
+from datetime import datetime, timedelta, timezone
+import json
 from decimal import Decimal
 from typing import List
 from unittest.mock import patch
 
 import pytest
 from store.core.exceptions import InsertionException
-from tests.factories import product_data
+from store.usecases.product import BULK_CREATE_MAX_SIZE, QUERY_MAX_LIMIT
+from tests.factories import product_data, products_data
 from fastapi import status
 
 
+def ndjson(response) -> List[dict]:
+    return [json.loads(line) for line in response.text.splitlines()]
+
+
 async def test_controller_create_should_return_success(client, products_url):
     response = await client.post(products_url, json=product_data())
 
@@ -27,6 +33,33 @@ async def test_controller_create_should_return_success(client, products_url):
     }
 
 
+async def test_controller_bulk_create_should_return_success(client, products_url):
+    response = await client.post(f"{products_url}bulk", json=products_data())
+
+    content = response.json()
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert [product["name"] for product in content] == [
+        product["name"] for product in products_data()
+    ]
+
+
+async def test_controller_bulk_create_should_reject_oversized_batch(
+    client, products_url
+):
+    response = await client.post(
+        f"{products_url}bulk", json=[product_data()] * (BULK_CREATE_MAX_SIZE + 1)
+    )
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+async def test_controller_bulk_create_should_reject_empty_batch(client, products_url):
+    response = await client.post(f"{products_url}bulk", json=[])
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
 async def test_controller_get_should_return_success(
     client, products_url, product_inserted
 ):
@@ -61,8 +94,8 @@ async def test_controller_query_should_return_success(client, products_url):
     response = await client.get(products_url)
 
     assert response.status_code == status.HTTP_200_OK
-    assert isinstance(response.json(), List)
-    assert len(response.json()) > 1
+    assert isinstance(ndjson(response), List)
+    assert len(ndjson(response)) > 1
 
 
 async def test_controller_patch_should_return_success(
@@ -84,7 +117,7 @@ async def test_controller_patch_should_return_success(
     assert content["status"] is True
     response_updated_at = datetime.fromisoformat(content["updated_at"])
     assert response_updated_at > original_updated_at
-    assert datetime.utcnow() - response_updated_at < datetime.timedelta(seconds=5)
+    assert datetime.now(timezone.utc) - response_updated_at < timedelta(seconds=5)
     assert datetime.fromisoformat(content["created_at"]) == product_inserted.created_at
 
 
@@ -157,11 +190,8 @@ async def products_inserted_for_filter(mongo_client, client):
         {"name": "Webcam", "quantity": 20, "price": "3000.00", "status": False},
         {"name": "Headset", "quantity": 15, "price": "7000.00", "status": True},
     ]
-    inserted_products = []
-    for p_data in products_data_list:
-        response = await client.post("/products/", json=p_data)
-        inserted_products.append(response.json())
-    return inserted_products
+    response = await client.post("/products/bulk", json=products_data_list)
+    return response.json()
 
 
 @pytest.mark.usefixtures("products_inserted_for_filter")
@@ -170,8 +200,8 @@ async def test_controller_query_should_return_success_without_filter(
 ):
     response = await client.get(products_url)
     assert response.status_code == status.HTTP_200_OK
-    assert isinstance(response.json(), List)
-    assert len(response.json()) == 5
+    assert isinstance(ndjson(response), List)
+    assert len(ndjson(response)) == 5
 
 
 async def test_controller_query_should_filter_by_price_range(
@@ -180,7 +210,7 @@ async def test_controller_query_should_filter_by_price_range(
     response = await client.get(products_url + "?min_price=5000&max_price=8000")
 
     assert response.status_code == status.HTTP_200_OK
-    content = response.json()
+    content = ndjson(response)
     assert isinstance(content, List)
     assert len(content) == 2
     for product in content:
@@ -195,7 +225,7 @@ async def test_controller_query_should_filter_by_min_price(
 ):
     response = await client.get(products_url + "?min_price=8000")
     assert response.status_code == status.HTTP_200_OK
-    content = response.json()
+    content = ndjson(response)
     assert len(content) == 1
     assert Decimal(content[0]["price"]) > Decimal("8000")
     assert content[0]["name"] == "Keyboard"
@@ -206,9 +236,42 @@ async def test_controller_query_should_filter_by_max_price(
 ):
     response = await client.get(products_url + "?max_price=5000")
     assert response.status_code == status.HTTP_200_OK
-    content = response.json()
+    content = ndjson(response)
     assert len(content) == 2
     for product in content:
         price = Decimal(product["price"])
         assert price < Decimal("5000")
         assert product["name"] in ["Monitor", "Webcam"]
+
+
+async def test_controller_query_should_paginate_sorted_by_price(
+    client, products_url, products_inserted_for_filter
+):
+    response = await client.get(products_url + "?limit=2&skip=1")
+    assert response.status_code == status.HTTP_200_OK
+    content = ndjson(response)
+    assert [product["name"] for product in content] == ["Monitor", "Mouse"]
+
+
+async def test_controller_query_should_filter_by_status(
+    client, products_url, products_inserted_for_filter
+):
+    response = await client.get(products_url + "?status=false")
+    assert response.status_code == status.HTTP_200_OK
+    content = ndjson(response)
+    assert [product["name"] for product in content] == ["Webcam"]
+
+
+async def test_controller_query_should_return_bad_request_on_out_of_range_price(
+    client, products_url
+):
+    response = await client.get(products_url + "?min_price=1e7000")
+
+    assert response.status_code == status.HTTP_400_BAD_REQUEST
+    assert response.json() == {"detail": "Price filter out of range."}
+
+
+async def test_controller_query_should_reject_limit_above_maximum(client, products_url):
+    response = await client.get(products_url + f"?limit={QUERY_MAX_LIMIT + 1}")
+
+    assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
@@ -1,4 +1,4 @@
-import datetime
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import List
 from unittest.mock import patch
@@ -6,26 +6,52 @@ from uuid import UUID
 
 import pymongo
 import pytest
-from store.core.exceptions import InsertionException, NotFoundException
+from store.core.exceptions import (
+    FilterException,
+    InsertionException,
+    NotFoundException,
+)
 from store.schemas.product import ProductIn, ProductOut, ProductUpdateOut
-from store.usecases.product import product_usecase
 
 
-async def test_usecases_create_should_return_success(product_in):
+async def test_usecases_create_should_return_success(product_usecase, product_in):
     result = await product_usecase.create(body=product_in)
 
     assert isinstance(result, ProductOut)
     assert result.name == "Iphone 14 Pro Max"
 
 
-async def test_usecases_get_should_return_success(product_inserted):
+async def test_usecases_bulk_create_should_return_success(product_usecase, products_in):
+    result = await product_usecase.bulk_create(bodies=products_in)
+
+    assert isinstance(result, List)
+    assert all(isinstance(product, ProductOut) for product in result)
+    assert [product.name for product in result] == [
+        product.name for product in products_in
+    ]
+
+
+async def test_usecases_bulk_create_should_raise_insertion_exception_on_duplicate_key(
+    product_usecase,
+    products_in,
+):
+    with pytest.raises(InsertionException) as excinfo:
+        await product_usecase.bulk_create(bodies=products_in + products_in[:1])
+
+    assert (
+        "Product with this name already exists "
+        "(inserted 4 of 5 products, failed indexes: [4])." == excinfo.value.message
+    )
+
+
+async def test_usecases_get_should_return_success(product_usecase, product_inserted):
     result = await product_usecase.get(id=product_inserted.id)
 
     assert isinstance(result, ProductOut)
     assert result.name == "Iphone 14 Pro Max"
 
 
-async def test_usecases_get_should_not_found():
+async def test_usecases_get_should_not_found(product_usecase):
     with pytest.raises(NotFoundException) as err:
         await product_usecase.get(id=UUID("1e4f214e-85f7-461a-89d0-a751a32e3bb9"))
 
@@ -36,14 +62,16 @@ async def test_usecases_get_should_not_found():
 
 
 @pytest.mark.usefixtures("products_inserted")
-async def test_usecases_query_should_return_success():
-    result = await product_usecase.query()
+async def test_usecases_query_should_return_success(product_usecase):
+    result = [product async for product in await product_usecase.query()]
 
     assert isinstance(result, List)
     assert len(result) > 1
 
 
-async def test_usecases_update_should_return_success(product_up, product_inserted):
+async def test_usecases_update_should_return_success(
+    product_usecase, product_up, product_inserted
+):
     original_updated_at = product_inserted.updated_at
 
     product_up.price = "7.500"
@@ -51,17 +79,17 @@ async def test_usecases_update_should_return_success(product_up, product_inserte
 
     assert isinstance(result, ProductUpdateOut)
     assert result.updated_at > original_updated_at
-    assert datetime.utcnow() - result.updated_at < datetime.timedelta(seconds=5)
+    assert datetime.now(timezone.utc) - result.updated_at < timedelta(seconds=5)
     assert result.price == 7.500
 
 
-async def test_usecases_delete_should_return_success(product_inserted):
+async def test_usecases_delete_should_return_success(product_usecase, product_inserted):
     result = await product_usecase.delete(id=product_inserted.id)
 
     assert result is True
 
 
-async def test_usecases_delete_should_not_found():
+async def test_usecases_delete_should_not_found(product_usecase):
     with pytest.raises(NotFoundException) as err:
         await product_usecase.delete(id=UUID("1e4f214e-85f7-461a-89d0-a751a32e3bb9"))
 
@@ -71,7 +99,9 @@ async def test_usecases_delete_should_not_found():
     )
 
 
-async def test_usecases_create_should_raise_insertion_exception_on_db_error(product_in):
+async def test_usecases_create_should_raise_insertion_exception_on_db_error(
+    product_usecase, product_in
+):
     with patch.object(
         product_usecase.collection,
         "insert_one",
@@ -83,6 +113,7 @@ async def test_usecases_create_should_raise_insertion_exception_on_db_error(prod
 
 
 async def test_usecases_create_should_raise_insertion_exception_on_duplicate_key(
+    product_usecase,
     product_in,
 ):
     with patch.object(
@@ -96,7 +127,7 @@ async def test_usecases_create_should_raise_insertion_exception_on_duplicate_key
 
 
 async def test_usecases_update_should_raise_insertion_exception_on_db_error(
-    product_up, product_inserted
+    product_usecase, product_up, product_inserted
 ):
     with patch.object(
         product_usecase.collection,
@@ -111,7 +142,7 @@ async def test_usecases_update_should_raise_insertion_exception_on_db_error(
         )
 
 
-async def test_usecases_update_should_raise_not_found(product_up):
+async def test_usecases_update_should_raise_not_found(product_usecase, product_up):
     with patch.object(
         product_usecase.collection, "find_one_and_update", return_value=None
     ):
@@ -126,7 +157,7 @@ async def test_usecases_update_should_raise_not_found(product_up):
 
 
 @pytest.fixture
-async def products_with_varied_prices(mongo_client):
+async def products_with_varied_prices(product_usecase, mongo_client):
     await mongo_client.get_database()["products"].delete_many({})
 
     products_data_list = [
@@ -142,24 +173,29 @@ async def products_with_varied_prices(mongo_client):
             name="Smartphone", quantity=15, price=Decimal("7000.00"), status=True
         ),
     ]
-    inserted_products = []
-    for p_in in products_data_list:
-        inserted_products.append(await product_usecase.create(body=p_in))
-    return inserted_products
+    return await product_usecase.bulk_create(bodies=products_data_list)
 
 
 async def test_usecases_query_should_return_all_products_without_filter(
+    product_usecase,
     products_with_varied_prices,
 ):
-    result = await product_usecase.query()
+    result = [product async for product in await product_usecase.query()]
     assert isinstance(result, List)
     assert len(result) == len(products_with_varied_prices)
 
 
-async def test_usecases_query_should_filter_by_price_range(products_with_varied_prices):
+async def test_usecases_query_should_filter_by_price_range(
+    product_usecase, products_with_varied_prices
+):
     min_price = Decimal("5000")
     max_price = Decimal("8000")
-    result = await product_usecase.query(min_price=min_price, max_price=max_price)
+    result = [
+        product
+        async for product in await product_usecase.query(
+            min_price=min_price, max_price=max_price
+        )
+    ]
 
     assert isinstance(result, List)
     assert len(result) == 2
@@ -169,9 +205,13 @@ async def test_usecases_query_should_filter_by_price_range(products_with_varied_
         assert product.name in ["Laptop Mid", "Smartphone"]
 
 
-async def test_usecases_query_should_filter_by_min_price(products_with_varied_prices):
+async def test_usecases_query_should_filter_by_min_price(
+    product_usecase, products_with_varied_prices
+):
     min_price = Decimal("8000")
-    result = await product_usecase.query(min_price=min_price)
+    result = [
+        product async for product in await product_usecase.query(min_price=min_price)
+    ]
 
     assert isinstance(result, List)
     assert len(result) == 1
@@ -179,12 +219,73 @@ async def test_usecases_query_should_filter_by_min_price(products_with_varied_pr
     assert result[0].name == "Laptop High"
 
 
-async def test_usecases_query_should_filter_by_max_price(products_with_varied_prices):
+async def test_usecases_query_should_filter_by_max_price(
+    product_usecase, products_with_varied_prices
+):
     max_price = Decimal("5000")
-    result = await product_usecase.query(max_price=max_price)
+    result = [
+        product async for product in await product_usecase.query(max_price=max_price)
+    ]
 
     assert isinstance(result, List)
     assert len(result) == 2
     for product in result:
         assert product.price < max_price
         assert product.name in ["Laptop Basic", "Tablet"]
+
+
+async def test_usecases_query_should_filter_by_status_and_price(
+    product_usecase, products_with_varied_prices
+):
+    max_price = Decimal("5000")
+    result = [
+        product
+        async for product in await product_usecase.query(
+            status=False, max_price=max_price
+        )
+    ]
+
+    assert [product.name for product in result] == ["Tablet"]
+
+
+async def test_usecases_query_should_raise_filter_exception_on_out_of_range_price(
+    product_usecase,
+):
+    with pytest.raises(FilterException) as excinfo:
+        await product_usecase.query(min_price=Decimal("1e7000"))
+
+    assert "Price filter out of range." == excinfo.value.message
+
+
+def find_stage(plan: dict, stage: str) -> dict | None:
+    if plan.get("stage") == stage:
+        return plan
+
+    children = [plan[key] for key in ("queryPlan", "inputStage") if key in plan]
+    for child in children + plan.get("inputStages", []):
+        found = find_stage(child, stage)
+        if found:
+            return found
+
+    return None
+
+
+async def test_usecases_query_price_range_should_use_price_index(
+    product_usecase, products_with_varied_prices
+):
+    cursor = product_usecase.build_cursor(
+        min_price=Decimal("5000"), max_price=Decimal("8000")
+    )
+    winning_plan = (await cursor.explain())["queryPlanner"]["winningPlan"]
+
+    assert find_stage(winning_plan, "COLLSCAN") is None
+    assert find_stage(winning_plan, "IXSCAN")["indexName"] == "price_1__id_1"
+
+
+async def test_usecases_query_should_paginate_sorted_by_price(
+    product_usecase,
+    products_with_varied_prices,
+):
+    result = [product async for product in await product_usecase.query(limit=2, skip=1)]
+
+    assert [product.name for product in result] == ["Laptop Basic", "Laptop Mid"]